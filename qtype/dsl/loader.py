@@ -27,8 +27,9 @@ from __future__ import annotations
 
 import os
 import re
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, Mapping
 
 import fsspec
 import yaml
@@ -69,15 +70,29 @@ class YAMLLoadError(Exception):
         return self.message
 
 
+# Matches ${VAR_NAME} or ${VAR_NAME:-default}
+_ENV_VAR_PATTERN = re.compile(r"\$\{([^}:]+)(?::-([^}]*))?\}")
+
+
 class YAMLLoader(yaml.SafeLoader):
     """YAML loader with env var substitution and file inclusion."""
 
-    def __init__(self, stream: Any, base_path: str | None = None) -> None:
+    def __init__(
+        self,
+        stream: Any,
+        base_path: str | None = None,
+        env: Mapping[str, str] | None = None,
+    ) -> None:
         super().__init__(stream)
         self.base_path = base_path or str(Path.cwd())
+        # Snapshot the environment once per load so every reference,
+        # including those in included files, sees the same values.
+        self.env = dict(os.environ) if env is None else env
 
 
-def _substitute_env_vars(value: str) -> str:
+def _substitute_env_vars(
+    value: str, env: Mapping[str, str] | None = None
+) -> str:
     """
     Substitute environment variables in a string.
 
@@ -85,6 +100,7 @@ def _substitute_env_vars(value: str) -> str:
 
     Args:
         value: String containing environment variable references
+        env: Environment to resolve against (default: os.environ)
 
     Returns:
         String with environment variables substituted
@@ -92,13 +108,18 @@ def _substitute_env_vars(value: str) -> str:
     Raises:
         ValueError: If required environment variable is not found
     """
-    pattern = r"\$\{([^}:]+)(?::-([^}]*))?\}"
+    # Most scalars contain no references; skip the regex engine entirely
+    if "${" not in value:
+        return value
+
+    if env is None:
+        env = os.environ
 
     def replace_env_var(match: re.Match[str]) -> str:
         var_name = match.group(1)
         default_value = match.group(2)
 
-        env_value = os.getenv(var_name)
+        env_value = env.get(var_name)
 
         if env_value is not None:
             return env_value
@@ -109,7 +130,7 @@ def _substitute_env_vars(value: str) -> str:
                 f"Environment variable '{var_name}' is required but not set"
             )
 
-    return re.sub(pattern, replace_env_var, value)
+    return _ENV_VAR_PATTERN.sub(replace_env_var, value)
 
 
 def _resolve_path(base_path: str, target_path: str) -> str:
@@ -125,16 +146,16 @@ def _resolve_path(base_path: str, target_path: str) -> str:
     Returns:
         Resolved absolute path or URI
     """
-    # If target is already absolute (has scheme or starts with /), use as-is
-    from urllib.parse import urljoin, urlparse
-
-    parsed = urlparse(target_path)
-    if parsed.scheme or target_path.startswith("/"):
+    # If target is already absolute (has scheme or starts with /), use as-is.
+    # A substring check is enough to spot a scheme and avoids building a
+    # ParseResult for the common local-file include.
+    if target_path.startswith("/") or "://" in target_path:
         return target_path
 
     # Check if base is URL-like
-    base_parsed = urlparse(base_path)
-    if base_parsed.scheme:
+    if "://" in base_path:
+        from urllib.parse import urljoin
+
         # URL-based resolution
         return urljoin(base_path, target_path)
     else:
@@ -148,7 +169,7 @@ def _resolve_path(base_path: str, target_path: str) -> str:
 def _env_var_constructor(loader: YAMLLoader, node: yaml.ScalarNode) -> str:
     """Constructor for environment variable substitution."""
     value = loader.construct_scalar(node)
-    return _substitute_env_vars(value)
+    return _substitute_env_vars(value, loader.env)
 
 
 def _include_constructor(loader: YAMLLoader, node: yaml.ScalarNode) -> Any:
@@ -156,19 +177,22 @@ def _include_constructor(loader: YAMLLoader, node: yaml.ScalarNode) -> Any:
     file_path = loader.construct_scalar(node)
     resolved_path = _resolve_path(loader.base_path, file_path)
 
+    # Read and release the handle before parsing so nested includes
+    # don't hold every parent file open.
     try:
         with fsspec.open(resolved_path, "r", encoding="utf-8") as f:
             content = f.read()  # type: ignore[misc]
-            # Create a partial function to pass base_path to YAMLLoader
-            from functools import partial
-
-            loader_class = partial(YAMLLoader, base_path=resolved_path)
-            return yaml.load(content, loader_class)  # type: ignore[arg-type]
     except (FileNotFoundError, IOError, OSError) as e:
         raise FileNotFoundError(
             f"Failed to load included file '{resolved_path}': {e}"
         ) from e
 
+    # Create a partial function to pass base_path to YAMLLoader
+    loader_class = partial(
+        YAMLLoader, base_path=resolved_path, env=loader.env
+    )
+    return yaml.load(content, loader_class)  # type: ignore[arg-type]
+
 
 def _include_raw_constructor(loader: YAMLLoader, node: yaml.ScalarNode) -> str:
     """Constructor for !include_raw tag to load external text files."""
@@ -280,8 +304,6 @@ def _parse_yaml(
         YAMLLoadError: If YAML parsing fails
     """
     try:
-        from functools import partial
-
         loader_class = partial(YAMLLoader, base_path=base_path)
         result = yaml.load(content, loader_class)  # type: ignore[arg-type]
         return result  # type: ignore[no-any-return]
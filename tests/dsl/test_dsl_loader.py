@@ -63,6 +63,15 @@ key: value
   invalid: indentation
 """
 
+    # Main-file skeletons that only vary by the included path
+    INCLUDE_AS_DATA = """
+data: !include {path}
+"""
+
+    INCLUDE_AS_DATABASE = """
+database: !include {path}
+"""
+
 
 class TestHelpers:
     """Helper methods for test setup and common operations."""
@@ -404,9 +413,7 @@ welcome_message: !include_raw message.txt
         main_file = TestHelpers.create_temp_file(
             temp_dir,
             "main.yaml",
-            """
-data: !include empty.yaml
-""",
+            TestFileFixtures.INCLUDE_AS_DATA.format(path="empty.yaml"),
         )
 
         # Load and verify
@@ -421,9 +428,7 @@ data: !include empty.yaml
         main_file = TestHelpers.create_temp_file(
             temp_dir,
             "main.yaml",
-            """
-data: !include malformed.yaml
-""",
+            TestFileFixtures.INCLUDE_AS_DATA.format(path="malformed.yaml"),
         )
         TestHelpers.assert_yaml_error(
             main_file, YAMLLoadError, "YAML parsing error"
@@ -444,9 +449,9 @@ value: "absolute_test"
         main_file = TestHelpers.create_temp_file(
             temp_dir,
             "main.yaml",
-            f"""
-data: !include {included_file.absolute()}
-""",
+            TestFileFixtures.INCLUDE_AS_DATA.format(
+                path=included_file.absolute()
+            ),
         )
 
         # Load and verify
@@ -486,9 +491,7 @@ app:
         main_file = TestHelpers.create_temp_file(
             temp_dir,
             "main.yaml",
-            """
-database: !include config.yaml
-""",
+            TestFileFixtures.INCLUDE_AS_DATABASE.format(path="config.yaml"),
         )
 
         # Load without setting env vars (should use defaults)
@@ -514,9 +517,9 @@ port: 443
             main_file = TestHelpers.create_temp_file(
                 temp_dir,
                 "main.yaml",
-                """
-database: !include config.yaml
-""",
+                TestFileFixtures.INCLUDE_AS_DATABASE.format(
+                    path="config.yaml"
+                ),
             )
 
             # Load and verify